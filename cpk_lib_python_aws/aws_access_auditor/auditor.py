@@ -1,17 +1,29 @@
 # -*- coding: utf-8 -*-
 """Core AWS SSO auditing functionality."""
-import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List
+
+from botocore.exceptions import ClientError
 
 from .aws_client_manager import AWSClientManager
 from .config import Config
 from .exceptions import AWSSSOAuditorError
 from .utils import clean_aws_response, safe_get_nested
 
+try:
+    # orjson parses nested policy documents several times faster than stdlib
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 logger = logging.getLogger(__name__)
 
+# Request the service maximum page size (100 for the SSO/identity store
+# list APIs) to halve pagination round-trips versus the default
+_MAX_PAGE = {"PageSize": 100}
+
 
 class NullOutputSink:
     """Null object pattern for output sink."""
@@ -54,6 +66,12 @@ class AWSSSOAuditor:
         self.identity_store_id = self.aws_manager.identity_store_id
         self.instance_arn = self.aws_manager.instance_arn
 
+        # Memoization caches for repeated AWS lookups (keyed by id/ARN)
+        self._group_details_cache = {}
+        self._user_details_cache = {}
+        self._ps_details_cache = {}
+        self._ps_policies_cache = {}
+
         # Show client info in debug mode
         if self.config.debug:
             client_info = self.aws_manager.get_client_info()
@@ -74,79 +92,136 @@ class AWSSSOAuditor:
             assignments = self.get_all_account_assignments(account_id)
             self.output_sink.debug_info(f"Found {len(assignments)} assignments")
 
+            metadata = {
+                "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "account_id": account_id,
+                "sso_instance_arn": self.instance_arn,
+                "identity_store_id": self.identity_store_id,
+                "auditor_version": "1.0.0",
+                "config": {
+                    "aws_region": self.config.aws_region,
+                    "output_formats": self.config.output_formats,
+                },
+            }
+
+            # Nothing to aggregate - skip the prefetch and assembly entirely
+            if not assignments:
+                logger.info("No assignments found for account %s", account_id)
+                return {
+                    "metadata": metadata,
+                    "sso_groups_summary": [],
+                    "sso_permission_sets_summary": [],
+                    "sso_groups": [],
+                    "permission_sets": [],
+                    "summary": {
+                        "total_groups": 0,
+                        "total_permission_sets": 0,
+                        "total_assignments": 0,
+                    },
+                }
+
             # Organize data
             groups_data = {}
             permission_sets_data = {}
-
-            self.output_sink.progress("Processing assignments...")
+            # Per-permission-set dedup sets for AssignedGroups membership
+            assigned_group_seen = {}
+
+            # Pass 1: collect unique principals/permission sets and the
+            # (type, principal, permission set) triples to join in pass 2
+            assignment_keys = []
+            group_ids = set()
+            permission_set_arns = set()
             for assignment in assignments:
                 principal_type = assignment["PrincipalType"]
                 principal_id = assignment["PrincipalId"]
                 permission_set_arn = assignment["PermissionSetArn"]
-
+                assignment_keys.append((principal_type, principal_id, permission_set_arn))
+                if principal_type == "GROUP":
+                    group_ids.add(principal_id)
+                permission_set_arns.add(permission_set_arn)
+
+            # Prefetch details for the deduplicated ids concurrently - each
+            # lookup is an independent network call
+
+            self.output_sink.progress("Prefetching group and permission set details...")
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                group_details_futures = {
+                    group_id: executor.submit(self.get_group_details, group_id)
+                    for group_id in group_ids
+                }
+                group_members_futures = {
+                    group_id: executor.submit(self.get_group_members, group_id)
+                    for group_id in group_ids
+                }
+                ps_details_futures = {
+                    arn: executor.submit(self.get_permission_set_details, arn)
+                    for arn in permission_set_arns
+                }
+                ps_policies_futures = {
+                    arn: executor.submit(self.get_permission_set_policies, arn)
+                    for arn in permission_set_arns
+                }
+
+                group_details_map = {
+                    group_id: future.result()
+                    for group_id, future in group_details_futures.items()
+                }
+                group_members_map = {
+                    group_id: future.result()
+                    for group_id, future in group_members_futures.items()
+                }
+                ps_details_map = {
+                    arn: future.result() for arn, future in ps_details_futures.items()
+                }
+                ps_policies_map = {
+                    arn: future.result() for arn, future in ps_policies_futures.items()
+                }
+
+            # Pass 2: assemble the result purely from the prefetched dicts,
+            # with no network I/O; summary name lists are collected inline
+            self.output_sink.progress("Processing assignments...")
+            group_names = []
+            permission_set_names = []
+            for principal_type, principal_id, permission_set_arn in assignment_keys:
                 if principal_type == "GROUP":
                     if principal_id not in groups_data:
                         self.output_sink.progress(f"Processing group: {principal_id}")
-                        group_details = self.get_group_details(principal_id)
-                        group_members = self.get_group_members(principal_id)
-                        groups_data[principal_id] = {
-                            **group_details,
-                            "Members": group_members,
-                            "PermissionSets": [],
-                        }
-
-                    # Get full permission set details for this group
-                    permission_set_details = self.get_permission_set_details(permission_set_arn)
-                    permission_set_policies = self.get_permission_set_policies(permission_set_arn)
-
-                    permission_set_full_details = {
-                        **permission_set_details,
-                        "Policies": permission_set_policies,
-                    }
+                        group_entry = group_details_map[principal_id].copy()
+                        group_entry["Members"] = group_members_map[principal_id]
+                        group_entry["PermissionSets"] = []
+                        groups_data[principal_id] = group_entry
+                        group_names.append(group_entry["DisplayName"])
+
+                    # Full permission set details for this group
+                    permission_set_full_details = ps_details_map[permission_set_arn].copy()
+                    permission_set_full_details["Policies"] = ps_policies_map[permission_set_arn]
 
                     groups_data[principal_id]["PermissionSets"].append(permission_set_full_details)
 
                 # Collect permission set data (only for those with assignments to this account)
                 if permission_set_arn not in permission_sets_data:
                     self.output_sink.progress(f"Processing permission set: {permission_set_arn}")
-                    permission_set_details = self.get_permission_set_details(permission_set_arn)
-                    permission_set_policies = self.get_permission_set_policies(permission_set_arn)
-                    permission_sets_data[permission_set_arn] = {
-                        **permission_set_details,
-                        "Policies": permission_set_policies,
-                        "AssignedGroups": [],
-                    }
-
-                if principal_type == "GROUP":
-                    if (
-                        principal_id
-                        not in permission_sets_data[permission_set_arn]["AssignedGroups"]
-                    ):
-                        permission_sets_data[permission_set_arn]["AssignedGroups"].append(
-                            principal_id
-                        )
-
-            # Create simple lists for summary
-            group_names = [group["DisplayName"] for group in groups_data.values()]
-            permission_set_names = [
-                ps.get("Name", "Unknown") for ps in permission_sets_data.values()
-            ]
+                    permission_set_entry = ps_details_map[permission_set_arn].copy()
+                    permission_set_entry["Policies"] = ps_policies_map[permission_set_arn]
+                    permission_set_entry["AssignedGroups"] = []
+                    permission_sets_data[permission_set_arn] = permission_set_entry
+                    assigned_group_seen[permission_set_arn] = set()
+                    permission_set_names.append(permission_set_entry.get("Name", "Unknown"))
+
+                # Keep assignment order in the output; the auxiliary set only
+                # provides the O(1) dedup check
+                if (
+                    principal_type == "GROUP"
+                    and principal_id not in assigned_group_seen[permission_set_arn]
+                ):
+                    assigned_group_seen[permission_set_arn].add(principal_id)
+                    permission_sets_data[permission_set_arn]["AssignedGroups"].append(principal_id)
 
             self.output_sink.progress("Finalizing audit results...")
 
             # Build final result
             result = {
-                "metadata": {
-                    "generated_at": datetime.now().isoformat(),
-                    "account_id": account_id,
-                    "sso_instance_arn": self.instance_arn,
-                    "identity_store_id": self.identity_store_id,
-                    "auditor_version": "1.0.0",
-                    "config": {
-                        "aws_region": self.config.aws_region,
-                        "output_formats": self.config.output_formats,
-                    },
-                },
+                "metadata": metadata,
                 "sso_groups_summary": group_names,
                 "sso_permission_sets_summary": permission_set_names,
                 "sso_groups": list(groups_data.values()),
@@ -165,132 +240,160 @@ class AWSSSOAuditor:
             logger.error("Audit failed for account %s: %s", account_id, e)
             raise AWSSSOAuditorError(f"Failed to audit account {account_id}: {e}") from e
 
-    def get_permission_sets_for_account(self, account_id: str) -> List[str]:
-        """Get only permission sets that are provisioned/assigned to the specific account."""
+    def get_permission_sets_for_account(self, account_id: str) -> Iterator[str]:
+        """Yield permission sets that are provisioned/assigned to the specific account."""
+        found = 0
         try:
-            permission_sets = []
             paginator = self.sso_admin_client.get_paginator(
                 "list_permission_sets_provisioned_to_account"
             )
 
-            for page in paginator.paginate(InstanceArn=self.instance_arn, AccountId=account_id):
-                permission_sets.extend(page["PermissionSets"])
+            for page in paginator.paginate(
+                InstanceArn=self.instance_arn,
+                AccountId=account_id,
+                PaginationConfig=_MAX_PAGE,
+            ):
+                found += len(page["PermissionSets"])
+                yield from page["PermissionSets"]
 
-            logger.info(
-                "Found %d permission sets provisioned to account %s",
-                len(permission_sets),
-                account_id,
-            )
-            return permission_sets
-        except Exception as e:
+            logger.info("Found %d permission sets provisioned to account %s", found, account_id)
+        except ClientError as e:
             logger.error("Error getting permission sets for account %s: %s", account_id, e)
-            return []
 
     def get_account_assignments_for_permission_set(
         self, permission_set_arn: str, account_id: str
-    ) -> List[Dict[str, Any]]:
-        """Get account assignments for a specific permission set and account."""
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield account assignments for a specific permission set and account."""
         try:
-            assignments = []
             paginator = self.sso_admin_client.get_paginator("list_account_assignments")
 
             for page in paginator.paginate(
                 InstanceArn=self.instance_arn,
                 AccountId=account_id,
                 PermissionSetArn=permission_set_arn,
+                PaginationConfig=_MAX_PAGE,
             ):
-                assignments.extend(page["AccountAssignments"])
-
-            return assignments
-        except Exception as e:
+                yield from page["AccountAssignments"]
+        except ClientError as e:
             logger.error(
                 "Error getting account assignments for permission set %s: %s", permission_set_arn, e
             )
-            return []
 
     def get_all_account_assignments(self, account_id: str) -> List[Dict[str, Any]]:
         """Get all account assignments for the given account.
 
         Only checks permission sets that are provisioned to this account.
+        Streams both paginators so assignment listing starts before the
+        permission set listing has finished.
         """
         all_assignments = []
 
-        # Get only permission sets that are provisioned to this account
-        permission_sets = self.get_permission_sets_for_account(account_id)
-
-        # Then get assignments for each provisioned permission set
-        for permission_set_arn in permission_sets:
-            assignments = self.get_account_assignments_for_permission_set(
-                permission_set_arn, account_id
+        # Only permission sets that are provisioned to this account
+        for permission_set_arn in self.get_permission_sets_for_account(account_id):
+            all_assignments.extend(
+                self.get_account_assignments_for_permission_set(permission_set_arn, account_id)
             )
-            all_assignments.extend(assignments)
 
         logger.info("Found %d total assignments for account %s", len(all_assignments), account_id)
         return all_assignments
 
     def get_group_details(self, group_id: str) -> Dict[str, Any]:
         """Get group details including name and description."""
+        if group_id in self._group_details_cache:
+            return self._group_details_cache[group_id]
+
         try:
             response = self.identitystore_client.describe_group(
                 IdentityStoreId=self.identity_store_id, GroupId=group_id
             )
-            return {
+            details = {
                 "GroupId": response["GroupId"],
                 "DisplayName": response["DisplayName"],
                 "Description": response.get("Description", ""),
             }
-        except Exception as e:
+        except ClientError as e:
             logger.error("Error getting group details for %s: %s", group_id, e)
-            return {"GroupId": group_id, "DisplayName": "Unknown", "Description": ""}
+            details = {"GroupId": group_id, "DisplayName": "Unknown", "Description": ""}
+
+        self._group_details_cache[group_id] = details
+        return details
 
     def get_group_members(self, group_id: str) -> List[Dict[str, Any]]:
         """Get all members of a group."""
         try:
-            members = []
+            user_ids = []
             paginator = self.identitystore_client.get_paginator("list_group_memberships")
 
             for page in paginator.paginate(
-                IdentityStoreId=self.identity_store_id, GroupId=group_id
+                IdentityStoreId=self.identity_store_id,
+                GroupId=group_id,
+                PaginationConfig=_MAX_PAGE,
             ):
-                for membership in page["GroupMemberships"]:
-                    user_id = membership["MemberId"]["UserId"]
-                    user_details = self.get_user_details(user_id)
-                    members.append(user_details)
+                user_ids.extend(
+                    membership["MemberId"]["UserId"] for membership in page["GroupMemberships"]
+                )
 
-            return members
-        except Exception as e:
+            if not user_ids:
+                return []
+
+            # Fan out the per-user describes - each is an independent network
+            # round-trip. A dedicated executor is used rather than the one in
+            # audit_account so nested submissions cannot deadlock the pool.
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                return list(executor.map(self.get_user_details, user_ids))
+        except ClientError as e:
             logger.error("Error getting group members for %s: %s", group_id, e)
             return []
 
     def get_user_details(self, user_id: str) -> Dict[str, Any]:
         """Get user details including username and display name."""
+        if user_id in self._user_details_cache:
+            return self._user_details_cache[user_id]
+
         try:
             response = self.identitystore_client.describe_user(
                 IdentityStoreId=self.identity_store_id, UserId=user_id
             )
-            return {
+            details = {
                 "UserId": response["UserId"],
                 "UserName": response["UserName"],
                 "DisplayName": response.get("DisplayName", response["UserName"]),
                 "Email": safe_get_nested(response, ["Emails", 0, "Value"], ""),
             }
-        except Exception as e:
+        except ClientError as e:
             logger.error("Error getting user details for %s: %s", user_id, e)
-            return {"UserId": user_id, "UserName": "Unknown", "DisplayName": "Unknown", "Email": ""}
+            details = {
+                "UserId": user_id,
+                "UserName": "Unknown",
+                "DisplayName": "Unknown",
+                "Email": "",
+            }
+
+        self._user_details_cache[user_id] = details
+        return details
 
     def get_permission_set_details(self, permission_set_arn: str) -> Dict[str, Any]:
         """Get permission set details."""
+        if permission_set_arn in self._ps_details_cache:
+            return self._ps_details_cache[permission_set_arn]
+
         try:
             response = self.sso_admin_client.describe_permission_set(
                 InstanceArn=self.instance_arn, PermissionSetArn=permission_set_arn
             )
-            return clean_aws_response(response["PermissionSet"])
-        except Exception as e:
+            details = clean_aws_response(response["PermissionSet"])
+        except ClientError as e:
             logger.error("Error getting permission set details for %s: %s", permission_set_arn, e)
-            return {}
+            details = {}
+
+        self._ps_details_cache[permission_set_arn] = details
+        return details
 
     def get_permission_set_policies(self, permission_set_arn: str) -> Dict[str, Any]:
         """Get all policies attached to a permission set."""
+        if permission_set_arn in self._ps_policies_cache:
+            return self._ps_policies_cache[permission_set_arn]
+
         policies = {"managed_policies": [], "customer_managed_policies": [], "inline_policy": None}
 
         try:
@@ -299,7 +402,9 @@ class AWSSSOAuditor:
                 "list_managed_policies_in_permission_set"
             )
             for page in managed_paginator.paginate(
-                InstanceArn=self.instance_arn, PermissionSetArn=permission_set_arn
+                InstanceArn=self.instance_arn,
+                PermissionSetArn=permission_set_arn,
+                PaginationConfig=_MAX_PAGE,
             ):
                 policies["managed_policies"].extend(page["AttachedManagedPolicies"])
 
@@ -308,7 +413,9 @@ class AWSSSOAuditor:
                 "list_customer_managed_policy_references_in_permission_set"
             )
             for page in customer_paginator.paginate(
-                InstanceArn=self.instance_arn, PermissionSetArn=permission_set_arn
+                InstanceArn=self.instance_arn,
+                PermissionSetArn=permission_set_arn,
+                PaginationConfig=_MAX_PAGE,
             ):
                 for policy_ref in page["CustomerManagedPolicyReferences"]:
                     policy_details = self.get_customer_managed_policy_details(policy_ref)
@@ -320,14 +427,15 @@ class AWSSSOAuditor:
                     InstanceArn=self.instance_arn, PermissionSetArn=permission_set_arn
                 )
                 if inline_response.get("InlinePolicy"):
-                    policies["inline_policy"] = json.loads(inline_response["InlinePolicy"])
+                    policies["inline_policy"] = _json.loads(inline_response["InlinePolicy"])
             except self.sso_admin_client.exceptions.ResourceNotFoundException:
                 # No inline policy exists
                 pass
 
-        except Exception as e:
+        except ClientError as e:
             logger.error("Error getting policies for permission set %s: %s", permission_set_arn, e)
 
+        self._ps_policies_cache[permission_set_arn] = policies
         return policies
 
     def get_customer_managed_policy_details(self, policy_ref: Dict[str, Any]) -> Dict[str, Any]:
@@ -339,6 +447,6 @@ class AWSSSOAuditor:
                 "Type": "CustomerManaged",
                 "Note": "Policy document not retrieved - requires target account access",
             }
-        except Exception as e:
+        except KeyError as e:
             logger.error("Error getting customer managed policy details: %s", e)
             return policy_ref
@@ -2,15 +2,48 @@
 """AWS client management for SSO auditing - extends shared base."""
 
 import logging
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from botocore.config import Config as BotocoreConfig
+from botocore.exceptions import BotoCoreError, ClientError
 
 from ..shared import AWSBaseClient
+from ..shared.aws_base import _get_shared_session
 from .config import Config
 from .exceptions import AWSClientError, SSOInstanceNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
+def _client_config(max_pool_connections: int) -> BotocoreConfig:
+    """Build a botocore config tuned for concurrent read-heavy auditing.
+
+    Connection pooling and TCP keepalive avoid repeated SSL handshakes
+    across paginator pages; adaptive retries apply client-side throttling
+    instead of failing with TooManyRequestsException under parallel load.
+    """
+    return BotocoreConfig(
+        max_pool_connections=max_pool_connections,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_client(profile: Optional[str], region: str, service: str, max_pool_connections: int = 10):
+    """Build (or reuse) a boto3 client for the given profile, region, and service.
+
+    Client construction is slow (service model loading, endpoint resolution),
+    so clients are cached per (profile, region, service) for the process.
+    All clients share the process-wide session (and its connection pool)
+    for their (profile, region).
+    """
+    return _get_shared_session(profile, region).client(
+        service, config=_client_config(max_pool_connections)
+    )
+
+
 class AWSClientManager(AWSBaseClient):
     """Manages AWS clients specific to SSO auditing."""
 
@@ -34,17 +67,30 @@ class AWSClientManager(AWSBaseClient):
     def _initialize_sso_clients(self) -> None:
         """Initialize SSO-specific AWS clients."""
         try:
-            # Initialize AWS clients
-            self.sso_admin_client = self.session.client("sso-admin")
-            self.identitystore_client = self.session.client("identitystore")
-            self.organizations_client = self.session.client("organizations")
+            # Initialize AWS clients, reusing cached ones unless opted out
+            # (e.g. tests with moto need fresh clients per instance)
+            pool_size = max(10, self.config.max_workers * 2)
+            if self.config.cache_clients:
+                profile, region = self.config.aws_profile, self.config.aws_region
+                self.sso_admin_client = _get_client(profile, region, "sso-admin", pool_size)
+                self.identitystore_client = _get_client(profile, region, "identitystore", pool_size)
+                self.organizations_client = _get_client(profile, region, "organizations", pool_size)
+            else:
+                client_config = _client_config(pool_size)
+                self.sso_admin_client = self.session.client("sso-admin", config=client_config)
+                self.identitystore_client = self.session.client(
+                    "identitystore", config=client_config
+                )
+                self.organizations_client = self.session.client(
+                    "organizations", config=client_config
+                )
 
             logger.info("SSO-specific AWS clients initialized successfully")
 
             # Discover SSO instance
             self._discover_sso_instance()
 
-        except Exception as e:
+        except (BotoCoreError, ClientError) as e:
             logger.error("Failed to initialize SSO clients: %s", e)
             raise AWSClientError(f"Error initializing SSO clients: {e}") from e
 
@@ -52,20 +98,18 @@ class AWSClientManager(AWSBaseClient):
         """Discover and validate SSO instance."""
         try:
             response = self.sso_admin_client.list_instances()
-            if not response["Instances"]:
-                raise SSOInstanceNotFoundError("No SSO instances found in this AWS account")
+        except (BotoCoreError, ClientError) as e:
+            logger.error("Failed to discover SSO instance: %s", e)
+            raise SSOInstanceNotFoundError(f"Failed to get SSO instance: {e}") from e
 
-            self.sso_instance = response["Instances"][0]
-            self.identity_store_id = self.sso_instance["IdentityStoreId"]
-            self.instance_arn = self.sso_instance["InstanceArn"]
+        if not response["Instances"]:
+            raise SSOInstanceNotFoundError("No SSO instances found in this AWS account")
 
-            logger.info("SSO instance discovered: %s", self.instance_arn)
+        self.sso_instance = response["Instances"][0]
+        self.identity_store_id = self.sso_instance["IdentityStoreId"]
+        self.instance_arn = self.sso_instance["InstanceArn"]
 
-        except Exception as e:
-            if "No SSO instances found" in str(e):
-                raise
-            logger.error("Failed to discover SSO instance: %s", e)
-            raise SSOInstanceNotFoundError(f"Failed to get SSO instance: {e}") from e
+        logger.info("SSO instance discovered: %s", self.instance_arn)
 
     def get_client_info(self) -> Dict[str, Any]:
         """Get information about configured SSO clients."""
@@ -2,8 +2,12 @@
 """CLI interface for AWS SSO Auditor."""
 
 import argparse
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from typing import List
 
 from ..shared import OutputSink  # <-- CHANGED: Import from shared instead of local
@@ -13,8 +17,30 @@ from .exceptions import AWSSSOAuditorError
 from .formatters import OutputFormatter
 
 
+_log_listener = None
+_log_stream = None
+
+
+def _stop_log_listener() -> None:
+    """Stop the background logging listener and flush buffered records."""
+    global _log_listener, _log_stream  # pylint: disable=global-statement
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+    if _log_stream is not None:
+        _log_stream.close()
+        _log_stream = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_logging(debug: bool = False, quiet: bool = False) -> None:
     """Setup logging configuration."""
+    global _log_listener, _log_stream  # pylint: disable=global-statement
+
     if quiet:
         level = logging.ERROR
     elif debug:
@@ -22,15 +48,37 @@ def setup_logging(debug: bool = False, quiet: bool = False) -> None:
     else:
         level = logging.INFO
 
+    # Route records through a queue so file/stream writes happen on a
+    # background thread instead of blocking the audit hot path. File
+    # output is additionally batched: records accumulate in a
+    # MemoryHandler and land on a 64 KiB buffered stream, so one write
+    # syscall covers many log lines instead of one per message.
+    _stop_log_listener()
+    log_queue = queue.Queue(-1)
+    _log_stream = open(  # pylint: disable=consider-using-with
+        "aws_access_auditor.log", "a", buffering=65536, encoding="utf-8"
+    )
+    file_handler = logging.StreamHandler(_log_stream)
+    memory_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    _log_listener = QueueListener(
+        log_queue, memory_handler, logging.StreamHandler(), respect_handler_level=True
+    )
+    _log_listener.start()
+
+    # force=True replaces any handlers from a previous call, so repeated
+    # setup_logging invocations don't leave a stale QueueHandler feeding a
+    # stopped listener's queue
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler("aws_access_auditor.log"), logging.StreamHandler()],
+        handlers=[QueueHandler(log_queue)],
+        force=True,
     )
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create CLI argument parser."""
+    """Create CLI argument parser (memoized; construction is pure)."""
     parser = argparse.ArgumentParser(
         description="Audit AWS SSO Groups and Permission Sets for an account",
         prog="aws-access-auditor",
@@ -68,10 +116,13 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Built once at import so repeated main() invocations skip parser construction
+_PARSER = create_parser()
+
+
 def main(args: List[str] = None) -> int:
     """Main CLI entry point."""
-    parser = create_parser()
-    parsed_args = parser.parse_args(args)
+    parsed_args = _PARSER.parse_args(args)
 
     # Setup logging
     setup_logging(parsed_args.debug, parsed_args.quiet)
@@ -2,13 +2,34 @@
 """Configuration management for AWS SSO Auditor."""
 
 import os
+import sys
 from dataclasses import dataclass
 from typing import List, Optional
 
 from .exceptions import ConfigurationError
 
 
-@dataclass
+def _snapshot_env() -> dict:
+    """Capture the environment variables Config reads, once per process."""
+    return {
+        "aws_region": os.getenv("AWS_REGION"),
+        "aws_profile": os.getenv("AWS_PROFILE"),
+        "output_directory": os.getenv("AWS_ACCESS_AUDITOR_OUTPUT_DIR"),
+        "debug": os.getenv("AWS_ACCESS_AUDITOR_DEBUG", "").lower() == "true",
+        "quiet": os.getenv("AWS_ACCESS_AUDITOR_QUIET", "").lower() == "true",
+    }
+
+
+_ENV = _snapshot_env()
+
+_VALID_FORMATS = frozenset(("json", "yaml", "both"))
+
+# Slotted dataclasses (smaller instances, faster attribute access) need
+# Python 3.10+; manual __slots__ would clash with the field defaults
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class Config:
     """Configuration for AWS SSO Auditor."""
 
@@ -16,6 +37,7 @@ class Config:
     aws_region: str = "us-east-1"
     aws_profile: Optional[str] = None
     timeout: int = 30
+    cache_clients: bool = True
 
     # Output Configuration
     output_formats: List[str] = None
@@ -25,30 +47,42 @@ class Config:
     # Behavior Configuration
     debug: bool = False
     quiet: bool = False
+    max_workers: int = 10
 
     def __post_init__(self):
         """Initialize configuration from environment variables."""
         if self.output_formats is None:
             self.output_formats = ["json", "yaml"]
 
-        # Override with environment variables
-        self.aws_region = os.getenv("AWS_REGION", self.aws_region)
-        self.aws_profile = os.getenv("AWS_PROFILE", self.aws_profile)
+        # Override with environment variables, read from the module-level
+        # snapshot so repeated construction skips the os.getenv lookups
+        self.aws_region = _ENV["aws_region"] or self.aws_region
+        self.aws_profile = _ENV["aws_profile"] or self.aws_profile
 
-        self.output_directory = os.getenv("AWS_ACCESS_AUDITOR_OUTPUT_DIR", self.output_directory)
-        if os.getenv("AWS_ACCESS_AUDITOR_DEBUG", "").lower() == "true":
+        self.output_directory = _ENV["output_directory"] or self.output_directory
+        if _ENV["debug"]:
             self.debug = True
-        if os.getenv("AWS_ACCESS_AUDITOR_QUIET", "").lower() == "true":
+        if _ENV["quiet"]:
             self.quiet = True
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Refresh the environment snapshot (for tests that mutate os.environ)."""
+        _ENV.clear()
+        _ENV.update(_snapshot_env())
+
     def validate(self) -> None:
         """Validate configuration settings."""
-        valid_formats = ["json", "yaml", "both"]
-        for fmt in self.output_formats:
-            if fmt not in valid_formats:
-                raise ConfigurationError(
-                    f"Invalid output format: {fmt}. Must be one of {valid_formats}"
-                )
+        # The default format list needs no scan
+        if self.output_formats != ["json", "yaml"]:
+            for fmt in self.output_formats:
+                if fmt not in _VALID_FORMATS:
+                    raise ConfigurationError(
+                        f"Invalid output format: {fmt}. Must be one of {sorted(_VALID_FORMATS)}"
+                    )
 
         if self.timeout <= 0:
             raise ConfigurationError("Timeout must be greater than 0")
+
+        if self.max_workers <= 0:
+            raise ConfigurationError("max_workers must be greater than 0")
@@ -4,19 +4,94 @@
 import json
 import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, List
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
 import yaml
 
+try:
+    # libyaml-backed dumper, several times faster on large audit payloads
+    from yaml import CSafeDumper as _BaseYamlDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseYamlDumper
+
+
+class _YamlDumper(_BaseYamlDumper):
+    """Dumper that expands repeated dicts instead of emitting aliases.
+
+    The auditor's memoization caches share policy and member dicts across
+    result entries; without this, PyYAML would collapse the repeats into
+    &id/*id anchors instead of the fully expanded blocks users expect.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+try:
+    # orjson serializes large result dicts several times faster than stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
 
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize data to pretty-printed UTF-8 JSON bytes."""
+    if orjson is not None:
+        # OPT_PASSTHROUGH_DATETIME routes datetimes through default=str like
+        # the stdlib fallback, so output is identical across installs
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+            default=str,
+        )
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def _stream_json_to_stdout(data: Dict[str, Any]) -> None:
+    """Emit data as indented JSON on stdout without a giant intermediate str.
+
+    orjson serializes straight to UTF-8 bytes; the stdlib fallback streams
+    iterencode chunks so the raw dict and the full pretty-printed string
+    never sit in memory at the same time.
+    """
+    if orjson is not None:
+        payload = _dump_json_bytes(data)
+        sys.stdout.write(payload.decode("utf-8"))
+    else:
+        for chunk in json.JSONEncoder(indent=2, default=str).iterencode(data):
+            sys.stdout.write(chunk)
+    sys.stdout.write("\n")
+
+
+def _write_bytes(filepath: str, payload: bytes) -> None:
+    """Write fully-serialized bytes with one open/write/close sequence.
+
+    Skips the TextIOWrapper buffering/encoding layers since the payload
+    is already encoded.
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # POSIX allows short writes, so loop until the whole payload lands
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class OutputFormatter:
     """Handles output formatting and file operations."""
 
+    # Directories already ensured this process, to skip repeat stat syscalls
+    _ensured_directories = set()
+
     def __init__(self, config: Config, output_sink=None):
         """Initialize formatter with configuration and optional output sink."""
         self.config = config
@@ -25,60 +100,67 @@ class OutputFormatter:
 
     def _ensure_output_directory(self) -> None:
         """Ensure output directory exists."""
+        directory = self.config.output_directory
+        if directory in self._ensured_directories:
+            return
+
         try:
-            os.makedirs(self.config.output_directory, exist_ok=True)
-            logger.debug("Output directory ensured: %s", self.config.output_directory)
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_directories.add(directory)
+            logger.debug("Output directory ensured: %s", directory)
         except Exception as e:
-            logger.error(
-                "Failed to create output directory %s: %s", self.config.output_directory, e
-            )
+            logger.error("Failed to create output directory %s: %s", directory, e)
             raise
 
     def save_results(self, data: Dict[str, Any], account_id: str) -> List[str]:
         """Save results to files based on configuration."""
-        saved_files = []
-
-        timestamp = (
-            datetime.now().strftime("%Y%m%d_%H%M%S") if self.config.include_timestamp else ""
-        )
-
-        for format_type in self.config.output_formats:
-            if format_type in ["json", "both"]:
-                json_file = self._save_json(data, account_id, timestamp)
-                saved_files.append(json_file)
-
-            if format_type in ["yaml", "both"]:
-                yaml_file = self._save_yaml(data, account_id, timestamp)
-                saved_files.append(yaml_file)
-
-        return saved_files
-
-    def _save_json(self, data: Dict[str, Any], account_id: str, timestamp: str) -> str:
-        """Save data as JSON file."""
-        filename_parts = ["aws_sso_audit", account_id]
+        # time.strftime formats straight from the epoch without building a
+        # datetime object first
+        timestamp = time.strftime("%Y%m%d_%H%M%S") if self.config.include_timestamp else ""
+
+        json_path, yaml_path = self._output_paths(account_id, timestamp)
+
+        # Set membership collapses the per-format branching and guarantees
+        # each file is written at most once even if "both" is combined with
+        # an explicit format
+        formats = set(self.config.output_formats)
+        if "both" in formats:
+            formats.update(("json", "yaml"))
+
+        jobs = []
+        if "json" in formats:
+            jobs.append(partial(self._save_json, data, json_path))
+        if "yaml" in formats:
+            jobs.append(partial(self._save_yaml, data, yaml_path))
+
+        if len(jobs) < 2:
+            return [job() for job in jobs]
+
+        # Serialization (GIL released in the C dumpers) and file writes for
+        # each format are independent, so overlap them
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(job) for job in jobs]
+            return [future.result() for future in futures]
+
+    def _output_paths(self, account_id: str, timestamp: str) -> Tuple[str, str]:
+        """Build the JSON and YAML output paths in one place."""
+        base = f"aws_sso_audit_{account_id}"
         if timestamp:
-            filename_parts.append(timestamp)
-        filename = "_".join(filename_parts) + ".json"
-
-        filepath = os.path.join(self.config.output_directory, filename)
+            base = f"{base}_{timestamp}"
+        directory = self.config.output_directory
+        return f"{directory}/{base}.json", f"{directory}/{base}.yaml"
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+    def _save_json(self, data: Dict[str, Any], filepath: str) -> str:
+        """Save data as JSON file."""
+        _write_bytes(filepath, _dump_json_bytes(data))
 
         logger.info("JSON results saved to: %s", filepath)
         return filepath
 
-    def _save_yaml(self, data: Dict[str, Any], account_id: str, timestamp: str) -> str:
+    def _save_yaml(self, data: Dict[str, Any], filepath: str) -> str:
         """Save data as YAML file."""
-        filename_parts = ["aws_sso_audit", account_id]
-        if timestamp:
-            filename_parts.append(timestamp)
-        filename = "_".join(filename_parts) + ".yaml"
-
-        filepath = os.path.join(self.config.output_directory, filename)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        payload = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        _write_bytes(filepath, payload.encode("utf-8"))
 
         logger.info("YAML results saved to: %s", filepath)
         return filepath
@@ -89,30 +171,32 @@ class OutputFormatter:
             return
 
         if self.output_sink:
-            # Use output sink for clean display
-            self.output_sink.separator()
-            self.output_sink.info("AWS SSO AUDIT RESULTS")
-            self.output_sink.separator()
-            self.output_sink.print_raw(json.dumps(data, indent=2, default=str))
+            # Use output sink for clean display; batch the header block so
+            # it lands in one flush
+            with self.output_sink.batch():
+                self.output_sink.separator()
+                self.output_sink.info("AWS SSO AUDIT RESULTS")
+                self.output_sink.separator()
         else:
             # Fallback to direct print (backward compatibility)
             print("\n" + "=" * 80)
             print("AWS SSO AUDIT RESULTS")
             print("=" * 80)
-            print(json.dumps(data, indent=2, default=str))
+
+        # quiet was already handled above, so stream straight to stdout
+        _stream_json_to_stdout(data)
 
     def format_summary(self, data: Dict[str, Any]) -> str:
         """Format a summary of audit results."""
-        summary = data.get("summary", {})
-        metadata = data.get("metadata", {})
-
-        lines = [
-            "📊 AWS SSO Audit Summary",
-            f"🆔 Account: {metadata.get('account_id', 'Unknown')}",
-            f"📅 Generated: {metadata.get('generated_at', 'Unknown')}",
-            f"👥 Groups: {summary.get('total_groups', 0)}",
-            f"🔐 Permission Sets: {summary.get('total_permission_sets', 0)}",
-            f"🔗 Assignments: {summary.get('total_assignments', 0)}",
-        ]
-
-        return "\n".join(lines)
+        s = data.get("summary", {})
+        m = data.get("metadata", {})
+
+        # One f-string builds the whole block in a single allocation
+        return (
+            f"📊 AWS SSO Audit Summary\n"
+            f"🆔 Account: {m.get('account_id', 'Unknown')}\n"
+            f"📅 Generated: {m.get('generated_at', 'Unknown')}\n"
+            f"👥 Groups: {s.get('total_groups', 0)}\n"
+            f"🔐 Permission Sets: {s.get('total_permission_sets', 0)}\n"
+            f"🔗 Assignments: {s.get('total_assignments', 0)}"
+        )
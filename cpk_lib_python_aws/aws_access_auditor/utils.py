@@ -13,33 +13,34 @@ def validate_account_id(account_id: str) -> bool:
 
 def format_permission_set_arn(instance_arn: str, permission_set_name: str) -> str:
     """Format permission set ARN from instance ARN and name."""
-    parts = instance_arn.split(":")
+    # Limited split plus rpartition: one capped scan for the account
+    # field and one reverse scan for the instance id, no extra lists
+    parts = instance_arn.split(":", 5)
     if len(parts) >= 6:
-        account = parts[4]
-        instance_id = instance_arn.split("/")[-1]
-        return f"arn:aws:sso:::{account}:permissionSet/{instance_id}/{permission_set_name}"
+        instance_id = instance_arn.rpartition("/")[2]
+        return f"arn:aws:sso:::{parts[4]}:permissionSet/{instance_id}/{permission_set_name}"
     return permission_set_name
 
 
-def safe_get_nested(data: Dict[str, Any], keys: List[str], default: Any = None) -> Any:
-    """Safely get nested dictionary value."""
-    current = data
-    for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
-            return default
-    return current
+def safe_get_nested(data: Dict[str, Any], keys: List[Any], default: Any = None) -> Any:
+    """Safely get nested dictionary/list value."""
+    # EAFP: indexing straight through is cheaper than per-level isinstance
+    # checks on the happy path, and also supports list indices
+    try:
+        for key in keys:
+            data = data[key]
+        return data
+    except (KeyError, IndexError, TypeError):
+        return default
+
+
+# Common AWS metadata keys stripped from API responses
+_METADATA_KEYS = frozenset(("ResponseMetadata", "NextToken", "IsTruncated"))
 
 
 def clean_aws_response(response: Dict[str, Any]) -> Dict[str, Any]:
     """Clean AWS API response by removing metadata."""
-    cleaned = response.copy()
-    # Remove common AWS metadata keys
-    metadata_keys = ["ResponseMetadata", "NextToken", "IsTruncated"]
-    for key in metadata_keys:
-        cleaned.pop(key, None)
-    return cleaned
+    return {key: value for key, value in response.items() if key not in _METADATA_KEYS}
 
 
 def format_timestamp(timestamp) -> str:
@@ -5,12 +5,32 @@ import logging
 from abc import ABC
 from typing import Any, Dict, Optional
 
-import boto3
+from botocore.exceptions import BotoCoreError, ClientError
 
 from .exceptions import AWSError, CredentialsError
 
 logger = logging.getLogger(__name__)
 
+# One session per (profile, region) so every client in the process shares
+# a single credentials chain resolution and connection pool
+_SESSION_CACHE: Dict[Any, Any] = {}
+
+
+def _get_shared_session(profile: Optional[str], region: str):
+    """Return the process-wide boto3 session for the given profile and region."""
+    # Imported lazily so `--help` and error paths never pay the
+    # boto3 import cost
+    import boto3  # pylint: disable=import-outside-toplevel
+
+    key = (profile, region)
+    session = _SESSION_CACHE.get(key)
+    if session is None:
+        session_kwargs = {"region_name": region}
+        if profile:
+            session_kwargs["profile_name"] = profile
+        session = _SESSION_CACHE[key] = boto3.Session(**session_kwargs)
+    return session
+
 
 class AWSBaseClient(ABC):
     """Base class for AWS service clients with common functionality."""
@@ -25,14 +45,10 @@ class AWSBaseClient(ABC):
     def _initialize_session(self) -> None:
         """Initialize boto3 session with optional profile."""
         try:
-            session_kwargs = {"region_name": self.region}
-            if self.profile:
-                session_kwargs["profile_name"] = self.profile
-
-            self.session = boto3.Session(**session_kwargs)
+            self.session = _get_shared_session(self.profile, self.region)
             logger.info("AWS session initialized for region: %s", self.region)
 
-        except Exception as e:
+        except BotoCoreError as e:
             logger.error("Failed to initialize AWS session: %s", e)
             raise CredentialsError(f"Failed to initialize AWS session: {e}") from e
 
@@ -41,5 +57,5 @@ class AWSBaseClient(ABC):
         try:
             sts_client = self.session.client("sts")
             return sts_client.get_caller_identity()
-        except Exception as e:
+        except (BotoCoreError, ClientError) as e:
             raise AWSError(f"Failed to get caller identity: {e}") from e
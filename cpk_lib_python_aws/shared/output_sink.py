@@ -2,30 +2,64 @@
 """Shared output sink for managing console output across AWS tools."""
 
 import sys
+from contextlib import contextmanager
 
 
 class OutputSink:
     """Manages console output with different verbosity levels across AWS tools."""
 
+    # Slot access is C-level and avoids a per-instance __dict__
+    __slots__ = ("quiet", "debug", "_buffer")
+
     def __init__(self, quiet: bool = False, debug: bool = False):
         """Initialize output sink with verbosity settings."""
         self.quiet = quiet
         self.debug = debug
+        self._buffer = None  # active batch buffer, or None when unbatched
+
+    def _emit(self, message: str, _print=print) -> None:
+        """Write one stdout line, collected while a batch() is active."""
+        if self._buffer is not None:
+            self._buffer.append(message + "\n")
+        else:
+            _print(message)
+
+    @contextmanager
+    def batch(self):
+        """Batch stdout writes into one writelines/flush on exit.
+
+        Collapses the per-line write syscalls of multi-line blocks
+        (summaries, result dumps) into a single flush. Errors still go
+        to stderr immediately.
+        """
+        if self._buffer is not None:
+            # Nested batches share the outer buffer
+            yield self
+            return
+
+        self._buffer = []
+        try:
+            yield self
+        finally:
+            buffered, self._buffer = self._buffer, None
+            if buffered:
+                sys.stdout.writelines(buffered)
+                sys.stdout.flush()
 
     def info(self, message: str) -> None:
         """Print informational message (suppressed in quiet mode)."""
         if not self.quiet:
-            print(message)
+            self._emit(message)
 
     def success(self, message: str) -> None:
         """Print success message (suppressed in quiet mode)."""
         if not self.quiet:
-            print(f"✅ {message}")
+            self._emit(f"✅ {message}")
 
     def warning(self, message: str) -> None:
         """Print warning message (always shown unless quiet)."""
         if not self.quiet:
-            print(f"⚠️  {message}")
+            self._emit(f"⚠️  {message}")
 
     def error(self, message: str) -> None:
         """Print error message (always shown, even in quiet mode)."""
@@ -34,17 +68,17 @@ class OutputSink:
     def debug_info(self, message: str) -> None:
         """Print debug message (only in debug mode)."""
         if self.debug and not self.quiet:
-            print(f"🔍 {message}")
+            self._emit(f"🔍 {message}")
 
     def progress(self, message: str) -> None:
         """Print progress message (only in debug mode)."""
         if self.debug and not self.quiet:
-            print(f"⏳ {message}")
+            self._emit(f"⏳ {message}")
 
     def separator(self, char: str = "=", length: int = 80) -> None:
         """Print separator line (suppressed in quiet mode)."""
         if not self.quiet:
-            print(char * length)
+            self._emit(char * length)
 
     def print_raw(self, message: str, file=None) -> None:
         """Print raw message without formatting (respects quiet mode for stdout)."""
@@ -53,14 +87,14 @@ class OutputSink:
             print(message, file=file)
         elif not self.quiet:
             # Print to stdout only if not quiet
-            print(message, file=file)
+            self._emit(message)
 
     def metric(self, name: str, value: str) -> None:
         """Print metric information (debug mode only)."""
         if self.debug and not self.quiet:
-            print(f"📊 {name}: {value}")
+            self._emit(f"📊 {name}: {value}")
 
     def timing(self, operation: str, duration: float) -> None:
         """Print timing information (debug mode only)."""
         if self.debug and not self.quiet:
-            print(f"⏱️  {operation}: {duration:.2f}s")
+            self._emit(f"⏱️  {operation}: {duration:.2f}s")
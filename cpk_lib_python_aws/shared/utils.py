@@ -1,23 +1,20 @@
 # -*- coding: utf-8 -*-
 """Shared AWS utility functions."""
-import re
 from typing import List
 
-import boto3
-
 
 def validate_account_id(account_id: str) -> bool:
     """Validate AWS account ID format."""
-    if not account_id:
-        return False
-
-    # AWS account IDs are 12-digit numbers
-    pattern = r"^\d{12}$"
-    return bool(re.match(pattern, account_id))
+    # AWS account IDs are 12-digit numbers; a length/isdigit check is
+    # several times faster than the equivalent regex
+    return bool(account_id) and len(account_id) == 12 and account_id.isdigit()
 
 
 def get_aws_regions() -> List[str]:
     """Get list of AWS regions."""
+    # Imported lazily so importing the shared package stays cheap
+    import boto3  # pylint: disable=import-outside-toplevel
+
     try:
         ec2 = boto3.client("ec2", region_name="us-east-1")
         response = ec2.describe_regions()
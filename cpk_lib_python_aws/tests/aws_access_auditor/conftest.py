@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures for AWS Access Auditor tests."""
+import pytest
+
+from cpk_lib_python_aws.aws_access_auditor.cli import create_parser
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Build the CLI argument parser once for the whole session."""
+    return create_parser()
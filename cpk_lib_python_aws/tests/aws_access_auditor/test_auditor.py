@@ -1,11 +1,35 @@
 # -*- coding: utf-8 -*-
 """Tests for AWS Access Auditor module."""
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
 
 from cpk_lib_python_aws.aws_access_auditor.auditor import AWSSSOAuditor, NullOutputSink
 from cpk_lib_python_aws.aws_access_auditor.config import Config
 
 
+def _client_error(message):
+    """Build a botocore ClientError with the given message."""
+    return ClientError({"Error": {"Code": "AccessDenied", "Message": message}}, "TestOperation")
+
+
+@pytest.fixture
+def aws_manager(mocker):
+    """Patch AWSClientManager and return a pre-populated mock instance."""
+    manager_class = mocker.patch(
+        "cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager", new_callable=Mock
+    )
+    manager = manager_class.return_value
+    manager.sso_admin_client = Mock()
+    manager.identitystore_client = Mock()
+    manager.organizations_client = Mock()
+    manager.identity_store_id = "d-123456789"
+    manager.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
+    manager.get_client_info.return_value = {"region": "us-east-1"}
+    return manager
+
+
 class TestNullOutputSink:
     """Test the NullOutputSink class."""
 
@@ -20,19 +44,21 @@ class TestNullOutputSink:
         assert sink.info("test message") is None
         assert sink.error("test message") is None
 
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_auditor_initialization_with_default_config(self, mock_aws_manager):
-        """Test auditor initialization with default configuration."""
-        # Mock the AWS client manager
-        mock_manager_instance = Mock()
-        mock_manager_instance.sso_admin_client = Mock()
-        mock_manager_instance.identitystore_client = Mock()
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-east-1"}
-        mock_aws_manager.return_value = mock_manager_instance
 
+class TestAWSSSOAuditor:
+    """Test the AWSSSOAuditor class."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_mgr(self, aws_manager):
+        """Install the patched client manager for every test in the class.
+
+        Function-scoped so per-test call records and side effects never
+        leak between tests.
+        """
+        self.mgr = aws_manager
+
+    def test_auditor_initialization_with_default_config(self):
+        """Test auditor initialization with default configuration."""
         auditor = AWSSSOAuditor()
 
         # Verify initialization
@@ -41,17 +67,9 @@ class TestNullOutputSink:
         assert auditor.identity_store_id == "d-123456789"
         assert auditor.instance_arn == "arn:aws:sso:::instance/ssoins-123456789"
 
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_auditor_initialization_with_custom_config(self, mock_aws_manager):
+    def test_auditor_initialization_with_custom_config(self):
         """Test auditor initialization with custom configuration."""
-        mock_manager_instance = Mock()
-        mock_manager_instance.sso_admin_client = Mock()
-        mock_manager_instance.identitystore_client = Mock()
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-west-2"}
-        mock_aws_manager.return_value = mock_manager_instance
+        self.mgr.get_client_info.return_value = {"region": "us-west-2"}
 
         config = Config(aws_region="us-west-2", debug=True)
         output_sink = Mock()
@@ -62,127 +80,67 @@ class TestNullOutputSink:
         assert auditor.config.debug is True
         assert auditor.output_sink == output_sink
 
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_get_permission_sets_for_account_success(self, mock_aws_manager):
-        """Test successful retrieval of permission sets for account."""
-        # Setup mocks
-        mock_manager_instance = Mock()
-        mock_sso_client = Mock()
-        mock_paginator = Mock()
-
-        mock_sso_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                "PermissionSets": [
+    @pytest.mark.parametrize(
+        "side_effect,expected",
+        [
+            pytest.param(
+                None,
+                [
                     "arn:aws:sso:::permissionSet/ps-123",
                     "arn:aws:sso:::permissionSet/ps-456",
-                ]
-            }
-        ]
-
-        mock_manager_instance.sso_admin_client = mock_sso_client
-        mock_manager_instance.identitystore_client = Mock()
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-east-1"}
-        mock_aws_manager.return_value = mock_manager_instance
-
-        auditor = AWSSSOAuditor()
-        result = auditor.get_permission_sets_for_account("123456789012")
-
-        assert len(result) == 2
-        assert "arn:aws:sso:::permissionSet/ps-123" in result
-        assert "arn:aws:sso:::permissionSet/ps-456" in result
-
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_get_permission_sets_for_account_failure(self, mock_aws_manager):
-        """Test handling of errors when retrieving permission sets."""
-        # Setup mocks to raise exception
-        mock_manager_instance = Mock()
-        mock_sso_client = Mock()
-        mock_sso_client.get_paginator.side_effect = Exception("AWS API Error")
-
-        mock_manager_instance.sso_admin_client = mock_sso_client
-        mock_manager_instance.identitystore_client = Mock()
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-east-1"}
-        mock_aws_manager.return_value = mock_manager_instance
-
-        auditor = AWSSSOAuditor()
-        result = auditor.get_permission_sets_for_account("123456789012")
-
-        # Should return empty list on error
-        assert result == []
-
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_get_group_details_success(self, mock_aws_manager):
-        """Test successful retrieval of group details."""
-        mock_manager_instance = Mock()
-        mock_identity_client = Mock()
-
-        mock_identity_client.describe_group.return_value = {
-            "GroupId": "group-123",
-            "DisplayName": "Test Group",
-            "Description": "A test group",
-        }
-
-        mock_manager_instance.sso_admin_client = Mock()
-        mock_manager_instance.identitystore_client = mock_identity_client
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-east-1"}
-        mock_aws_manager.return_value = mock_manager_instance
+                ],
+                id="success",
+            ),
+            # Should yield nothing on error
+            pytest.param(_client_error("AWS API Error"), [], id="failure"),
+        ],
+    )
+    def test_get_permission_sets_for_account(self, side_effect, expected):
+        """Test retrieval of permission sets for account, success and failure."""
+        get_paginator = self.mgr.sso_admin_client.get_paginator
+        get_paginator.side_effect = side_effect
+        if side_effect is None:
+            get_paginator.return_value.paginate.return_value = [{"PermissionSets": expected}]
 
         auditor = AWSSSOAuditor()
-        result = auditor.get_group_details("group-123")
-
-        assert result["GroupId"] == "group-123"
-        assert result["DisplayName"] == "Test Group"
-        assert result["Description"] == "A test group"
-
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_get_group_details_failure(self, mock_aws_manager):
-        """Test handling of errors when retrieving group details."""
-        mock_manager_instance = Mock()
-        mock_identity_client = Mock()
-        mock_identity_client.describe_group.side_effect = Exception("Group not found")
-
-        mock_manager_instance.sso_admin_client = Mock()
-        mock_manager_instance.identitystore_client = mock_identity_client
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-east-1"}
-        mock_aws_manager.return_value = mock_manager_instance
+        result = list(auditor.get_permission_sets_for_account("123456789012"))
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "side_effect,expected",
+        [
+            pytest.param(
+                None,
+                {
+                    "GroupId": "group-123",
+                    "DisplayName": "Test Group",
+                    "Description": "A test group",
+                },
+                id="success",
+            ),
+            # Should return default values on error
+            pytest.param(
+                _client_error("Group not found"),
+                {"GroupId": "group-123", "DisplayName": "Unknown", "Description": ""},
+                id="failure",
+            ),
+        ],
+    )
+    def test_get_group_details(self, side_effect, expected):
+        """Test retrieval of group details, success and failure."""
+        describe_group = self.mgr.identitystore_client.describe_group
+        describe_group.side_effect = side_effect
+        if side_effect is None:
+            describe_group.return_value = expected
 
         auditor = AWSSSOAuditor()
         result = auditor.get_group_details("group-123")
 
-        # Should return default values on error
-        assert result["GroupId"] == "group-123"
-        assert result["DisplayName"] == "Unknown"
-        assert result["Description"] == ""
+        assert result == expected
 
-    @patch("cpk_lib_python_aws.aws_access_auditor.auditor.AWSClientManager")
-    def test_audit_account_basic_flow(self, mock_aws_manager):
+    def test_audit_account_basic_flow(self):
         """Test basic audit_account flow with minimal data."""
-        mock_manager_instance = Mock()
-        mock_sso_client = Mock()
-        mock_identity_client = Mock()
-
-        # Mock get_all_account_assignments to return empty list
-        mock_manager_instance.sso_admin_client = mock_sso_client
-        mock_manager_instance.identitystore_client = mock_identity_client
-        mock_manager_instance.organizations_client = Mock()
-        mock_manager_instance.identity_store_id = "d-123456789"
-        mock_manager_instance.instance_arn = "arn:aws:sso:::instance/ssoins-123456789"
-        mock_manager_instance.get_client_info.return_value = {"region": "us-east-1"}
-        mock_aws_manager.return_value = mock_manager_instance
-
         auditor = AWSSSOAuditor()
 
         # Mock the get_permission_sets_for_account to return empty list
@@ -1,36 +1,33 @@
 # -*- coding: utf-8 -*-
 """Tests for AWS Access Auditor configuration module."""
-import os
-
 import pytest
 
 from cpk_lib_python_aws.aws_access_auditor.config import Config
 from cpk_lib_python_aws.aws_access_auditor.exceptions import ConfigurationError
 
 
-def test_default_config_values():
-    """Test that default configuration values are set correctly."""
-    config = Config()
-    assert config.aws_region == "us-east-1"
-    assert config.output_formats == ["json", "yaml"]
-    assert config.output_directory == "."
-    assert config.include_timestamp is True
-    assert config.debug is False
-    assert config.quiet is False
-    assert config.timeout == 30
-    assert config.aws_profile is None
+@pytest.fixture(scope="module")
+def default_config():
+    """Build one default Config for the defaults-only assertions."""
+    return Config()
 
 
-def test_config_validation_valid_formats():
-    """Test that valid output formats pass validation."""
-    config = Config(output_formats=["json"])
-    config.validate()
+def test_default_config_values(default_config):
+    """Test that default configuration values are set correctly."""
+    assert default_config.aws_region == "us-east-1"
+    assert default_config.output_formats == ["json", "yaml"]
+    assert default_config.output_directory == "."
+    assert default_config.include_timestamp is True
+    assert default_config.debug is False
+    assert default_config.quiet is False
+    assert default_config.timeout == 30
+    assert default_config.aws_profile is None
 
-    config = Config(output_formats=["yaml"])
-    config.validate()
 
-    config = Config(output_formats=["both"])
-    config.validate()
+@pytest.mark.parametrize("fmt", [["json"], ["yaml"], ["both"]])
+def test_config_validation_valid_formats(fmt):
+    """Test that valid output formats pass validation."""
+    Config(output_formats=fmt).validate()
 
 
 def test_config_validation_invalid_format():
@@ -40,12 +37,12 @@ def test_config_validation_invalid_format():
         config.validate()
 
 
-def test_environment_variable_override():
+def test_environment_variable_override(monkeypatch):
     """Test that environment variables override default values."""
-    # Set environment variables
-    os.environ["AWS_REGION"] = "eu-west-1"
-    os.environ["AWS_ACCESS_AUDITOR_DEBUG"] = "true"
-    os.environ["AWS_ACCESS_AUDITOR_QUIET"] = "true"
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_ACCESS_AUDITOR_DEBUG", "true")
+    monkeypatch.setenv("AWS_ACCESS_AUDITOR_QUIET", "true")
+    Config.reload_env()
 
     try:
         config = Config()
@@ -53,10 +50,10 @@ def test_environment_variable_override():
         assert config.debug is True
         assert config.quiet is True
     finally:
-        # Clean up environment variables
-        os.environ.pop("AWS_REGION", None)
-        os.environ.pop("AWS_ACCESS_AUDITOR_DEBUG", None)
-        os.environ.pop("AWS_ACCESS_AUDITOR_QUIET", None)
+        # Restore the environment and refresh the module-level snapshot
+        # even on assertion failure, so later tests see clean defaults
+        monkeypatch.undo()
+        Config.reload_env()
 
 
 def test_constructor_overrides():
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Tests for AWS SSO Auditor output formatters."""
+from cpk_lib_python_aws.aws_access_auditor.config import Config
+from cpk_lib_python_aws.aws_access_auditor.formatters import OutputFormatter
+
+
+def test_save_yaml_expands_shared_dicts(tmp_path):
+    """Test that repeated dict objects are dumped in full, not as aliases."""
+    config = Config(
+        output_directory=str(tmp_path), output_formats=["yaml"], include_timestamp=False
+    )
+    formatter = OutputFormatter(config)
+
+    # The auditor's caches share one policies dict across result entries
+    policies = {"ManagedPolicies": [{"Name": "ReadOnlyAccess"}]}
+    data = {
+        "sso_groups": [{"GroupId": "group-123", "Policies": policies}],
+        "permission_sets": [{"Name": "ReadOnly", "Policies": policies}],
+    }
+
+    saved_files = formatter.save_results(data, "123456789012")
+
+    with open(saved_files[0], encoding="utf-8") as yaml_file:
+        content = yaml_file.read()
+
+    assert "&id" not in content
+    assert "*id" not in content
+    assert content.count("ReadOnlyAccess") == 2
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Shared test configuration for cpk_lib_python_aws.
+
+Eagerly imports the modules that tests patch by dotted path, so
+mock.patch resolves them from sys.modules instead of triggering a
+first-time import inside the first test that runs.
+"""
+import cpk_lib_python_aws.aws_access_auditor.auditor  # noqa: F401
+import cpk_lib_python_aws.aws_access_auditor.cli  # noqa: F401
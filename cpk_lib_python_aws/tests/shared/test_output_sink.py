@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared OutputSink."""
+from cpk_lib_python_aws.shared import OutputSink
+
+
+class TestOutputSinkBatch:
+    """Test the batch() context manager."""
+
+    def test_batch_flushes_on_exit(self, capsys):
+        """Test that batched stdout lines are held until the block exits."""
+        sink = OutputSink()
+
+        with sink.batch():
+            sink.info("first")
+            sink.success("second")
+            assert capsys.readouterr().out == ""
+
+        assert capsys.readouterr().out == "first\n✅ second\n"
+
+    def test_batch_error_bypasses_buffer(self, capsys):
+        """Test that errors reach stderr immediately inside a batch."""
+        sink = OutputSink()
+
+        with sink.batch():
+            sink.error("boom")
+            assert "❌ boom" in capsys.readouterr().err
+
+        # Nothing was buffered for stdout
+        assert capsys.readouterr().out == ""
+
+    def test_nested_batch_shares_outer_buffer(self, capsys):
+        """Test that a nested batch flushes with the outer one."""
+        sink = OutputSink()
+
+        with sink.batch():
+            sink.info("outer")
+            with sink.batch():
+                sink.info("inner")
+            assert capsys.readouterr().out == ""
+
+        assert capsys.readouterr().out == "outer\ninner\n"